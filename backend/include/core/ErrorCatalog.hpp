@@ -28,6 +28,7 @@ inline constexpr const char* D2400_RECORD_START_FAILED = "record.start failed";
 inline constexpr const char* D2400_MISSING_RECORDING_ID = "missing params.recording_id";
 inline constexpr const char* D2400_UNKNOWN_RECORDING_ID = "unknown recording_id";
 inline constexpr const char* D2400_QEC_MEASUREMENTS_NOT_ARRAY = "params.measurements must be array";
+inline constexpr const char* D2400_QEC_ROUNDS_OUT_OF_RANGE = "params.rounds out of range";
 
 // Recorder validation / I/O details (kept in catalog to avoid ad-hoc strings crossing RPC boundary).
 inline constexpr const char* D2400_RECORD_PARAMS_NOT_OBJECT = "record.start params must be object";
@@ -4,7 +4,9 @@ Minimal QEC service stub for StoneGate backend.
 Accepts POST /api/qec/submit, GET /api/qec/status/<job_id>, GET /api/qec/result/<job_id>
 Implements job queue and returns dummy corrections.
 """
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+import functools
+import queue
 import threading
 import time
 import uuid
@@ -12,7 +14,18 @@ import json as pyjson
 import os
 
 app = Flask(__name__)
-jobs = {}
+# job state, shared between request handlers and the worker pool.
+# Kept as parallel maps keyed by job id so status polls never touch results.
+job_status = {}
+job_progress = {}
+job_result = {}
+jobs_lock = threading.Lock()
+# notified on every job state/progress change (used by long-poll status requests)
+jobs_changed = threading.Condition(jobs_lock)
+QEC_STATUS_MAX_WAIT_S = 30.0
+QEC_WORKERS = int(os.environ.get('QEC_STUB_WORKERS', '4'))
+QEC_QUEUE_MAX = int(os.environ.get('QEC_STUB_QUEUE_MAX', '256'))
+job_queue = queue.Queue(maxsize=QEC_QUEUE_MAX)
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'shared', 'protocol'))
 PARTS_FILE = os.path.join(BASE_DIR, 'PartsLibrary.json')
 USER_PARTS_FILE = os.path.join(BASE_DIR, 'user_parts.json')
@@ -40,19 +53,128 @@ try:
 except Exception:
     JSONSCHEMA_AVAILABLE = False
 
-def load_parts():
-    parts = {}
+# optional fast JSON library (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+# orjson turns integer literals beyond 64 bits into floats (or rejects them, depending on the
+# version); any 19+ digit run sends the text to stdlib json, which keeps them exact. Scanned
+# with translate + find (a regex scan costs more than stdlib json's whole parse).
+_DIGITS_TO_ZERO = bytes(0x30 if 0x30 <= b <= 0x39 else 0x20 for b in range(256))
+_LONG_DIGIT_RUN = b'0' * 19
+
+
+def _orjson_can_decode(data):
+    if isinstance(data, str):
+        data = data.encode('utf-8', 'surrogatepass')
+    return bytes(data).translate(_DIGITS_TO_ZERO).find(_LONG_DIGIT_RUN) < 0
+
+
+if ORJSON_AVAILABLE:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson (used by jsonify and request.get_json)."""
+
+        def dumps(self, obj, **kwargs):
+            option = orjson.OPT_NON_STR_KEYS
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+
+        def loads(self, s, **kwargs):
+            if _orjson_can_decode(s):
+                try:
+                    return orjson.loads(s)
+                except orjson.JSONDecodeError:
+                    pass  # NaN/Infinity: stdlib json accepts them
+            return super().loads(s, **kwargs)
+
+    app.json = OrjsonProvider(app)
+
+
+def _json_loads(data):
+    if ORJSON_AVAILABLE and _orjson_can_decode(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity: stdlib json accepts them
+    return pyjson.loads(data)
+
+
+def json_response(payload, status=200):
+    """Pre-serialized JSON response for frequently polled endpoints (bypasses jsonify)."""
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = pyjson.dumps(payload)
+    return Response(body, status=status, mimetype='application/json')
+
+
+def _json_dumps_pretty(obj):
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return pyjson.dumps(obj, indent=2).encode('utf-8')
+
+
+def read_json_file(path):
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path, mtime_ns, size):
+    return read_json_file(path)
+
+
+def load_json_cached(path):
+    """Parse a JSON file, reusing the previous result while its mtime/size are unchanged.
+    The returned object is shared; callers must copy it before mutating.
+    """
+    st = os.stat(path)
+    return _load_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def write_json_file(path, obj):
+    # Serialize first, then issue a single write (json.dump writes token by token).
+    # Write to a sibling temp file and rename it over the target so concurrent
+    # readers see either the old or the new file, never a truncated one.
+    data = _json_dumps_pretty(obj)
+    tmp = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    finally:
+        _load_cached.cache_clear()
+
+
+def _load_builtin_parts():
+    """Builtin PartsLibrary.json via the mtime cache (shared object: do not mutate)."""
     try:
-        with open(PARTS_FILE, 'r') as f:
-            parts = pyjson.load(f)
+        return load_json_cached(PARTS_FILE)
     except Exception:
-        parts = {}
+        return {}
+
+
+def load_parts():
+    parts = dict(_load_builtin_parts())
     # merge user parts, override defaults
     try:
-        with open(USER_PARTS_FILE, 'r') as uf:
-            user = pyjson.load(uf)
-            for k, v in user.items():
-                parts[k] = v
+        user = load_json_cached(USER_PARTS_FILE)
+        for k, v in user.items():
+            parts[k] = v
     except Exception:
         pass
     return parts
@@ -61,23 +183,19 @@ def save_user_part(name, spec):
     user = {}
     try:
         if os.path.exists(USER_PARTS_FILE):
-            with open(USER_PARTS_FILE, 'r') as uf:
-                user = pyjson.load(uf)
+            user = read_json_file(USER_PARTS_FILE)
     except Exception:
         user = {}
     user[name] = spec
-    with open(USER_PARTS_FILE, 'w') as uf:
-        pyjson.dump(user, uf, indent=2)
+    write_json_file(USER_PARTS_FILE, user)
 
 def delete_user_part(name):
     try:
         if os.path.exists(USER_PARTS_FILE):
-            with open(USER_PARTS_FILE, 'r') as uf:
-                user = pyjson.load(uf)
+            user = read_json_file(USER_PARTS_FILE)
             if name in user:
                 del user[name]
-                with open(USER_PARTS_FILE, 'w') as uf:
-                    pyjson.dump(user, uf, indent=2)
+                write_json_file(USER_PARTS_FILE, user)
                 return True
     except Exception:
         pass
@@ -86,8 +204,7 @@ def delete_user_part(name):
 
 def load_device_overrides():
     try:
-        with open(OVERRIDES_FILE, 'r') as f:
-            return pyjson.load(f)
+        return read_json_file(OVERRIDES_FILE)
     except Exception:
         return {}
 
@@ -96,24 +213,20 @@ def save_device_override(device_id, override):
     overrides = {}
     try:
         if os.path.exists(OVERRIDES_FILE):
-            with open(OVERRIDES_FILE, 'r') as f:
-                overrides = pyjson.load(f)
+            overrides = read_json_file(OVERRIDES_FILE)
     except Exception:
         overrides = {}
     overrides[device_id] = override
-    with open(OVERRIDES_FILE, 'w') as f:
-        pyjson.dump(overrides, f, indent=2)
+    write_json_file(OVERRIDES_FILE, overrides)
 
 
 def delete_device_override(device_id):
     try:
         if os.path.exists(OVERRIDES_FILE):
-            with open(OVERRIDES_FILE, 'r') as f:
-                overrides = pyjson.load(f)
+            overrides = read_json_file(OVERRIDES_FILE)
             if device_id in overrides:
                 del overrides[device_id]
-                with open(OVERRIDES_FILE, 'w') as f:
-                    pyjson.dump(overrides, f, indent=2)
+                write_json_file(OVERRIDES_FILE, overrides)
                 return True
     except Exception:
         pass
@@ -123,50 +236,97 @@ def delete_device_override(device_id):
 def submit():
     data = request.get_json(force=True)
     job_id = data.get('job_id') or str(uuid.uuid4())
-    jobs[job_id] = {'status': 'queued', 'result': None, 'progress': 0.0}
-    # Start background job
-    threading.Thread(target=run_job, args=(job_id, data), daemon=True).start()
+    with jobs_lock:
+        job_status[job_id] = 'queued'
+        job_progress[job_id] = 0.0
+        job_result[job_id] = None
+    # Hand off to the worker pool; reject instead of growing without bound
+    try:
+        job_queue.put_nowait((job_id, data))
+    except queue.Full:
+        with jobs_lock:
+            forget_job(job_id)
+        return jsonify({'error': STRINGS.get('qec', {}).get('queue_full', 'job queue full; retry later')}), 503
     return jsonify({'job_id': job_id, 'status': STRINGS.get('qec', {}).get('queued', 'queued')})
 
 def run_job(job_id, data):
-    jobs[job_id]['status'] = 'running'
+    update_job(job_id, status='running')
     for i in range(5):
         time.sleep(0.2)
-        jobs[job_id]['progress'] = (i+1)/5
+        update_job(job_id, progress=(i+1)/5)
     # Dummy correction: flip all syndrome bits
-    corrections = []
-    for m in data.get('measurements', []):
-        corrections.append({'qubit': m['qubit'], 'round': m['round'], 'correction': 1-m['value']})
-    jobs[job_id]['result'] = {
+    corrections = [
+        {'qubit': m['qubit'], 'round': m['round'], 'correction': 1-m['value']}
+        for m in data.get('measurements', [])
+    ]
+    update_job(job_id, result={
         'job_id': job_id,
         'status': 'done',
         'corrections': corrections,
         'statistics': {'dummy': True},
         'raw_decision': None
-    }
-    jobs[job_id]['status'] = 'done'
-    jobs[job_id]['progress'] = 1.0
+    }, status='done', progress=1.0)
+
+def update_job(job_id, status=None, progress=None, result=None):
+    with jobs_changed:
+        if result is not None:
+            job_result[job_id] = result
+        if progress is not None:
+            job_progress[job_id] = progress
+        if status is not None:
+            job_status[job_id] = status
+        jobs_changed.notify_all()
+
+def forget_job(job_id):
+    # caller holds jobs_lock
+    job_status.pop(job_id, None)
+    job_progress.pop(job_id, None)
+    job_result.pop(job_id, None)
+
+def job_worker():
+    while True:
+        job_id, data = job_queue.get()
+        try:
+            run_job(job_id, data)
+        except Exception:
+            # keep the worker alive; malformed payloads only fail their own job
+            update_job(job_id, status='error')
+        finally:
+            job_queue.task_done()
+
+for _ in range(QEC_WORKERS):
+    threading.Thread(target=job_worker, daemon=True).start()
 
 @app.route('/api/qec/status/<job_id>', methods=['GET'])
 def status(job_id):
-    job = jobs.get(job_id)
-    if not job:
-        return jsonify({'error': 'not found'}), 404
-    return jsonify({'job_id': job_id, 'status': job['status'], 'progress': job.get('progress', 0.0)})
+    """Job status. With ?wait=<seconds> (long-poll), block until the job's status or
+    progress changes, the job finishes, or the timeout elapses.
+    """
+    wait = min(max(request.args.get('wait', 0.0, type=float), 0.0), QEC_STATUS_MAX_WAIT_S)
+    with jobs_changed:
+        st = job_status.get(job_id)
+        if st is None:
+            return json_response({'error': 'not found'}, 404)
+        if wait > 0 and st not in ('done', 'error'):
+            seen = (st, job_progress[job_id])
+            jobs_changed.wait_for(lambda: (job_status[job_id], job_progress[job_id]) != seen, timeout=wait)
+        payload = {'job_id': job_id, 'status': job_status[job_id], 'progress': job_progress[job_id]}
+    return json_response(payload)
 
 @app.route('/api/qec/result/<job_id>', methods=['GET'])
 def result(job_id):
-    job = jobs.get(job_id)
-    if not job or not job['result']:
-        return jsonify({'error': 'not ready'}), 404
-    return jsonify(job['result'])
+    with jobs_lock:
+        res = job_result.get(job_id)
+    if not res:
+        return json_response({'error': 'not ready'}, 404)
+    return json_response(res)
 
 
 # Parts management API
 @app.route('/api/parts', methods=['GET'])
 def list_parts():
     parts = load_parts()
-    return jsonify(parts)
+    return json_response(parts)
 
 
 @app.route('/api/parts/save', methods=['POST'])
@@ -177,11 +337,7 @@ def save_part():
     if not name or not spec:
         return jsonify({'error': STRINGS.get('parts', {}).get('name_and_spec_required', 'name and spec required')}), 400
     # prevent overwriting default parts: if name exists in builtin PartsLibrary, require save_as_new flag
-    try:
-        with open(PARTS_FILE, 'r') as f:
-            builtin = pyjson.load(f)
-    except Exception:
-        builtin = {}
+    builtin = _load_builtin_parts()
     if name in builtin and not data.get('save_as_new'):
         return jsonify({'error': STRINGS.get('parts', {}).get('cannot_overwrite_builtin', 'cannot overwrite builtin part; set save_as_new and provide new_name')}), 400
     # if save_as_new requested and new_name provided, use that
@@ -211,7 +367,7 @@ def reset_part():
 @app.route('/api/device_overrides', methods=['GET'])
 def list_device_overrides():
     overrides = load_device_overrides()
-    return jsonify(overrides)
+    return json_response(overrides)
 
 
 @app.route('/api/device_overrides/save', methods=['POST'])
@@ -253,8 +409,7 @@ def reload_device_overrides_route():
         # ensure file exists
         if not os.path.exists(OVERRIDES_FILE):
             # create an empty overrides file
-            with open(OVERRIDES_FILE, 'w') as f:
-                pyjson.dump({}, f, indent=2)
+            write_json_file(OVERRIDES_FILE, {})
         # touch the file (update mtime)
         now = time.time()
         os.utime(OVERRIDES_FILE, (now, now))
@@ -16,6 +16,8 @@
 #include <boost/beast/websocket.hpp>
 #include <boost/asio/ip/tcp.hpp>
 #include <boost/asio/strand.hpp>
+#include <boost/asio/steady_timer.hpp>
+#include <deque>
 #include <mutex>
 #include <set>
 #include <random>
@@ -79,10 +81,13 @@ static nlohmann::json sg_capabilities() {
         "graph.list",
         "graph.set_active",
         "device.action",
+        "device.get",
+        "device.watch",
         "record.start",
         "record.stop",
         "qec.decode",
-        "qec.benchmark"
+        "qec.benchmark",
+        "qec.acquire_repetition"
     });
 }
 
@@ -149,6 +154,21 @@ static std::string sg_read_text_file_allow_fail(const std::filesystem::path& p)
     }
 }
 
+// Upper bound on a single `device.watch` wait, so one request cannot keep a timer sampling forever.
+static constexpr double SG_DEVICE_WATCH_MAX_TIMEOUT_S = 300.0;
+
+// Upper bound on `qec.acquire_repetition` rounds per request; the rounds run synchronously on the io thread
+// (~0.45 ms each in the simulator, so one request blocks other sessions for ~0.1 s at most).
+static constexpr int SG_QEC_ACQUIRE_MAX_ROUNDS = 256;
+
+// Value of `metric` in a device measurement ({measurements: {metric: {value}}} or a flat object); null if absent.
+static nlohmann::json sg_metric_value(const nlohmann::json& m, const std::string& metric) {
+    const auto& metrics = (m.contains("measurements") && m["measurements"].is_object()) ? m["measurements"] : m;
+    if (!metrics.is_object() || !metrics.contains(metric)) return nullptr;
+    const auto& v = metrics[metric];
+    return (v.is_object() && v.contains("value")) ? v["value"] : v;
+}
+
 WebSocketServer::WebSocketServer(int p, DeviceRegistry& reg, bool sim_mode, std::string device_graph_path)
 : port(p), sim_mode_(sim_mode), device_graph_path_(std::move(device_graph_path)), running(false), registry(reg) {}
 
@@ -159,6 +179,7 @@ struct WebSocketServer::Impl {
     bool ok = false;
     std::mutex sessions_m;
     std::set<std::shared_ptr<websocket::stream<tcp::socket>>> sessions;
+    std::set<std::string> session_ids;
     Impl(int port): ioc(), acceptor(ioc) {
         boost::system::error_code ec;
         acceptor.open(tcp::v4(), ec);
@@ -186,20 +207,26 @@ struct WebSocketServer::Impl {
         ok = true;
     }
 
-    void add_session(std::shared_ptr<websocket::stream<tcp::socket>> s) {
+    void add_session(std::shared_ptr<websocket::stream<tcp::socket>> s, const std::string& session_id) {
         {
             std::lock_guard<std::mutex> lk(sessions_m);
             sessions.insert(s);
+            session_ids.insert(session_id);
             std::cerr << "WebSocketServer: client connected (count=" << sessions.size() << ")" << std::endl;
         }
     }
-    void remove_session(std::shared_ptr<websocket::stream<tcp::socket>> s) {
+    void remove_session(std::shared_ptr<websocket::stream<tcp::socket>> s, const std::string& session_id) {
         {
             std::lock_guard<std::mutex> lk(sessions_m);
             sessions.erase(s);
+            session_ids.erase(session_id);
             std::cerr << "WebSocketServer: client disconnected (count=" << sessions.size() << ")" << std::endl;
         }
     }
+    bool has_session(const std::string& session_id) {
+        std::lock_guard<std::mutex> lk(sessions_m);
+        return session_ids.count(session_id) != 0;
+    }
     template<typename Fn>
     void for_each_session(Fn&& fn) {
         std::lock_guard<std::mutex> lk(sessions_m);
@@ -264,7 +291,7 @@ void WebSocketServer::run_event_loop() {
                             return;
                         }
                         const std::string session_id = sg_random_id().substr(0, 12);
-                        impl->add_session(ws);
+                        impl->add_session(ws, session_id);
 
                         // Send a descriptor snapshot on connect for discovery.
                         try {
@@ -282,7 +309,7 @@ void WebSocketServer::run_event_loop() {
                         *do_read = [this, ws, buffer, do_read, session_id]() {
                             ws->async_read(*buffer, [this, ws, buffer, do_read, session_id](boost::system::error_code ec, std::size_t bytes_transferred){
                                 if (ec) {
-                                    impl->remove_session(ws);
+                                    impl->remove_session(ws, session_id);
                                     return;
                                 }
                                 try {
@@ -858,6 +885,104 @@ void WebSocketServer::handle_message(const nlohmann::json& msg, const std::funct
                 rpc_ok(id, { {"device_id", device_id}, {"applied", true} });
                 return;
             }
+            if (method == "device.get") {
+                // Single-device read; with `metric`, reply with just that value instead of the full snapshot.
+                const auto device_id = params.value("device_id", std::string{});
+                if (device_id.empty()) { rpc_error(id, stonegate::errors::E2400_CONTROL_REJECTED, stonegate::errors::format_E2400_control_rejected(stonegate::errors::D2400_MISSING_DEVICE_ID), { {"detail", stonegate::errors::D2400_MISSING_DEVICE_ID} }); return; }
+                auto dev = registry.get_device(device_id);
+                if (!dev) { rpc_error(id, stonegate::errors::E2400_CONTROL_REJECTED, stonegate::errors::format_E2400_control_rejected(stonegate::errors::D2400_UNKNOWN_DEVICE), { {"detail", stonegate::errors::D2400_UNKNOWN_DEVICE}, {"device_id", device_id} }); return; }
+                auto m = dev->read_measurement();
+                const auto metric = params.value("metric", std::string{});
+                if (metric.empty()) {
+                    rpc_ok(id, { {"device_id", device_id}, {"measurement", m} });
+                    return;
+                }
+                rpc_ok(id, { {"device_id", device_id}, {"metric", metric}, {"value", sg_metric_value(m, metric)} });
+                return;
+            }
+            if (method == "device.watch") {
+                // Server-side wait_for_stable: sample the metric on an I/O-context timer (never blocking the
+                // event loop) and reply once, when max-min over `window_s` stays within `tolerance` for
+                // `consecutive` samples, or after `timeout_s` (capped at SG_DEVICE_WATCH_MAX_TIMEOUT_S; the
+                // reply echoes the effective value so clients can re-issue for the rest of a longer wait).
+                // A watch whose WebSocket session has gone away stops sampling and never replies.
+                const auto device_id = params.value("device_id", std::string{});
+                if (device_id.empty()) { rpc_error(id, stonegate::errors::E2400_CONTROL_REJECTED, stonegate::errors::format_E2400_control_rejected(stonegate::errors::D2400_MISSING_DEVICE_ID), { {"detail", stonegate::errors::D2400_MISSING_DEVICE_ID} }); return; }
+                auto dev = registry.get_device(device_id);
+                if (!dev || !impl) { rpc_error(id, stonegate::errors::E2400_CONTROL_REJECTED, stonegate::errors::format_E2400_control_rejected(stonegate::errors::D2400_UNKNOWN_DEVICE), { {"detail", stonegate::errors::D2400_UNKNOWN_DEVICE}, {"device_id", device_id} }); return; }
+
+                struct Watch {
+                    std::string id, device_id, metric, session_id;
+                    std::shared_ptr<Device> dev;
+                    std::function<void(const nlohmann::json&)> reply;
+                    double tolerance = 0.0, window_s = 1.0, timeout_s = 30.0;
+                    int consecutive = 3, ok = 0, samples = 0;
+                    std::chrono::steady_clock::time_point start;
+                    std::chrono::milliseconds poll{50};
+                    std::deque<double> ts;
+                    std::deque<std::pair<double, double>> maxq, minq;
+                    asio::steady_timer timer;
+                    explicit Watch(asio::io_context& ioc) : timer(ioc) {}
+                };
+                auto w = std::make_shared<Watch>(impl->ioc);
+                w->id = id;
+                w->device_id = device_id;
+                w->metric = params.value("metric", std::string{});
+                w->session_id = session_id;
+                w->dev = dev;
+                w->reply = reply;
+                try { w->tolerance = params.value("tolerance", 0.0); } catch (...) {}
+                try { w->window_s = std::max(0.0, params.value("window_s", 1.0)); } catch (...) {}
+                try { w->timeout_s = std::min(std::max(0.0, params.value("timeout_s", 30.0)), SG_DEVICE_WATCH_MAX_TIMEOUT_S); } catch (...) {}
+                try { w->consecutive = std::max(1, params.value("consecutive", 3)); } catch (...) {}
+                // Same cadence the SDK's client-side loop uses: window/4, clamped to [50 ms, 500 ms].
+                w->poll = std::chrono::milliseconds((int)(1000.0 * std::min(0.5, std::max(0.05, w->window_s / 4))));
+                w->start = std::chrono::steady_clock::now();
+
+                // The pending timer handler owns `step`; once it stops re-arming, everything is released.
+                auto step = std::make_shared<std::function<void()>>();
+                std::weak_ptr<std::function<void()>> weak_step = step;
+                std::weak_ptr<Impl> weak_impl = impl;
+                *step = [w, weak_step, weak_impl]() {
+                    // Server stopping or client disconnected: drop the watch (releasing its reply/socket).
+                    auto im = weak_impl.lock();
+                    if (!im || (!w->session_id.empty() && !im->has_session(w->session_id))) return;
+                    const double now = std::chrono::duration<double>(std::chrono::steady_clock::now() - w->start).count();
+                    auto finish = [&](bool stable) {
+                        w->reply({ {"type", "rpc_result"}, {"id", w->id}, {"ok", true}, {"result", {
+                            {"device_id", w->device_id}, {"metric", w->metric}, {"stable", stable},
+                            {"elapsed_s", now}, {"samples", w->samples}, {"timeout_s", w->timeout_s}
+                        }} });
+                    };
+                    if (now >= w->timeout_s) { finish(false); return; }
+                    nlohmann::json v = nullptr;
+                    try { v = sg_metric_value(w->dev->read_measurement(), w->metric); } catch (...) {}
+                    if (v.is_number()) {
+                        const double x = v.get<double>();
+                        ++w->samples;
+                        w->ts.push_back(now);
+                        while (!w->maxq.empty() && w->maxq.back().second <= x) w->maxq.pop_back();
+                        w->maxq.emplace_back(now, x);
+                        while (!w->minq.empty() && w->minq.back().second >= x) w->minq.pop_back();
+                        w->minq.emplace_back(now, x);
+                    }
+                    while (!w->ts.empty() && (now - w->ts.front()) > w->window_s) w->ts.pop_front();
+                    while (!w->maxq.empty() && (now - w->maxq.front().first) > w->window_s) w->maxq.pop_front();
+                    while (!w->minq.empty() && (now - w->minq.front().first) > w->window_s) w->minq.pop_front();
+                    if (w->ts.size() >= 2) {
+                        w->ok = (std::abs(w->maxq.front().second - w->minq.front().second) <= w->tolerance) ? w->ok + 1 : 0;
+                        if (w->ok >= w->consecutive) { finish(true); return; }
+                    }
+                    w->timer.expires_after(w->poll);
+                    if (auto self = weak_step.lock()) {
+                        w->timer.async_wait([self](boost::system::error_code ec) {
+                            if (!ec) (*self)();
+                        });
+                    }
+                };
+                (*step)();
+                return;
+            }
             if (method == "record.start") {
                 if (!recorder) { rpc_error(id, stonegate::errors::E2400_CONTROL_REJECTED, stonegate::errors::format_E2400_control_rejected(stonegate::errors::D2400_RECORDER_NOT_INITIALIZED), { {"detail", stonegate::errors::D2400_RECORDER_NOT_INITIALIZED} }); return; }
                 try {
@@ -915,6 +1040,40 @@ void WebSocketServer::handle_message(const nlohmann::json& msg, const std::funct
                 return;
             }
 
+            if (method == "qec.acquire_repetition") {
+                // Drive a QECModule through `rounds` syndrome extractions in one round-trip and
+                // return the measured bits (same sequence a client would see polling after each round).
+                const auto device_id = params.value("device_id", std::string{"qec0"});
+                auto dev = registry.get_device(device_id);
+                if (!dev) { rpc_error(id, stonegate::errors::E2400_CONTROL_REJECTED, stonegate::errors::format_E2400_control_rejected(stonegate::errors::D2400_UNKNOWN_DEVICE), { {"detail", stonegate::errors::D2400_UNKNOWN_DEVICE}, {"device_id", device_id} }); return; }
+                // Read as double so out-of-range numbers are rejected instead of wrapping on conversion.
+                double rounds_d = 1.0;
+                try { rounds_d = params.value("rounds", 1.0); } catch (...) {}
+                if (!(rounds_d >= 0.0 && rounds_d <= SG_QEC_ACQUIRE_MAX_ROUNDS)) {
+                    rpc_error(id, stonegate::errors::E2400_CONTROL_REJECTED, stonegate::errors::format_E2400_control_rejected(stonegate::errors::D2400_QEC_ROUNDS_OUT_OF_RANGE), { {"detail", stonegate::errors::D2400_QEC_ROUNDS_OUT_OF_RANGE}, {"rounds", rounds_d}, {"max_rounds", SG_QEC_ACQUIRE_MAX_ROUNDS} });
+                    return;
+                }
+                const int rounds = static_cast<int>(rounds_d);
+                if (params.contains("set_true_bit") && params["set_true_bit"].is_number_integer()) {
+                    dev->perform_action({ {"set_true_bit", params["set_true_bit"].get<int>()} });
+                }
+                const nlohmann::json extract = { {"extract_syndrome", true} };
+                nlohmann::json values = nlohmann::json::array();
+                for (int r = 0; r < rounds; ++r) {
+                    dev->perform_action(extract);
+                    int bit = 0;
+                    try {
+                        const auto m = dev->read_measurement();
+                        const auto& syn = m.at("measurements").at("syndrome").at("value");
+                        bit = (syn.is_number() && syn.get<double>() != 0.0) ? 1 : 0;
+                    } catch (...) {
+                    }
+                    values.push_back(bit);
+                }
+                rpc_ok(id, { {"device_id", device_id}, {"rounds", rounds}, {"values", values} });
+                return;
+            }
+
             if (method == "qec.benchmark") {
                 // Backend-owned micro-benchmarking harness for demos.
                 // Input loosely follows shared/protocol/MessageTypes.ts QECBenchmarkRequest.
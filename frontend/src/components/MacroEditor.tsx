@@ -1448,10 +1448,12 @@ export default function MacroEditor() {
           }
           if (s.kind === 'while') {
             const maxIt = Math.max(1, s.max_iterations)
+            const condVar = `cond_${s.id.replace(/[^a-zA-Z0-9_]/g, '_')}`
             out.push(`${pad(indent)}# ###> "${escPy(s.name)}" <### (while block)`)
+            out.push(`${pad(indent)}${condVar} = sg.compile_condition("${escPy(s.condition.op)}", ${s.condition.value})`)
             out.push(`${pad(indent)}for _i in range(${maxIt}):`)
             out.push(`${pad(indent + 2)}latest = await sg.get_latest_number("${escPy(s.condition.device_id)}", "${escPy(s.condition.metric)}")`)
-            out.push(`${pad(indent + 2)}if not sg.eval_condition(latest, "${escPy(s.condition.op)}", ${s.condition.value}):`)
+            out.push(`${pad(indent + 2)}if not ${condVar}(latest):`)
             out.push(`${pad(indent + 4)}break`)
             out.push(...renderStepsPython(s.steps, indent + 2, activeRecVar))
             continue
@@ -1726,10 +1728,12 @@ export default function MacroEditor() {
         return lines
       }
       if (step.kind === 'while') {
+        const condVar = `cond_${step.id.replace(/[^a-zA-Z0-9_]/g, '_')}`
         lines.push(`${pad(indent)}# Condition: ${esc(step.condition.device_id)}.${esc(step.condition.metric)} ${step.condition.op} ${step.condition.value}`)
+        lines.push(`${pad(indent)}${condVar} = sg.compile_condition("${esc(step.condition.op)}", ${step.condition.value})`)
         lines.push(`${pad(indent)}for _i in range(${Math.max(1, step.max_iterations)}):`)
         lines.push(`${pad(indent + 2)}latest = await sg.get_latest_number("${esc(step.condition.device_id)}", "${esc(step.condition.metric)}")`)
-        lines.push(`${pad(indent + 2)}if not sg.eval_condition(latest, "${esc(step.condition.op)}", ${step.condition.value}):`)
+        lines.push(`${pad(indent + 2)}if not ${condVar}(latest):`)
         lines.push(`${pad(indent + 4)}break`)
         for (const inner of step.steps) lines.push(...renderPythonStep(inner, indent + 2))
         return lines
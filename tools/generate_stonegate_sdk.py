@@ -5,6 +5,7 @@
 This repo keeps the *source of truth* for the SDK in:
     - tools/sdk_sources/stonegate_api.py
     - tools/sdk_sources/stonegate_qec.py
+    - tools/sdk_sources/stonegate_qec_kernels.py
     - tools/sdk_sources/stonegate_api.hpp
     - tools/sdk_sources/stonegate_qec.hpp
 
@@ -57,10 +58,11 @@ def generate(*, repo_root: Path) -> list[Path]:
     sources = repo_root / "tools" / "sdk_sources"
     api_py = sources / "stonegate_api.py"
     qec_py = sources / "stonegate_qec.py"
+    qec_kernels_py = sources / "stonegate_qec_kernels.py"
     api_hpp = sources / "stonegate_api.hpp"
     qec_hpp = sources / "stonegate_qec.hpp"
 
-    missing = [p for p in (api_py, qec_py, api_hpp, qec_hpp) if not p.exists()]
+    missing = [p for p in (api_py, qec_py, qec_kernels_py, api_hpp, qec_hpp) if not p.exists()]
     if missing:
         raise SystemExit(f"Missing required source files: {', '.join(str(p) for p in missing)}")
 
@@ -72,6 +74,7 @@ def generate(*, repo_root: Path) -> list[Path]:
         "# Do not edit in sdk/. Edit the source-of-truth files instead:\n"
         "#   - tools/sdk_sources/stonegate_api.py\n"
         "#   - tools/sdk_sources/stonegate_qec.py\n"
+        "#   - tools/sdk_sources/stonegate_qec_kernels.py\n"
         "#   - tools/sdk_sources/stonegate_api.hpp\n"
         "#   - tools/sdk_sources/stonegate_qec.hpp\n"
         "# Regenerate with: python3 tools/generate_stonegate_sdk.py\n\n"
@@ -89,8 +92,11 @@ description = "StoneGate SDK helpers (generated from the StoneGate repo)"
 requires-python = ">=3.10"
 dependencies = ["websockets>=11"]
 
+[project.optional-dependencies]
+fast = ["orjson>=3.9"]
+
 [tool.setuptools]
-packages = ["stonegate_api", "stonegate_qec"]
+packages = ["stonegate_api", "stonegate_qec", "stonegate_qec_kernels"]
 """
 
     readme = """# StoneGate SDK (generated)
@@ -116,12 +122,14 @@ sg.WS_URL = "ws://localhost:8080/status"
     # Convert the single-file modules into package __init__.py files.
     api_pkg = header + _read_text(api_py)
     qec_pkg = header + _read_text(qec_py)
+    qec_kernels_pkg = header + _read_text(qec_kernels_py)
 
     for p, t in [
         (sdk_py_root / "pyproject.toml", pyproject),
         (sdk_py_root / "README.md", readme),
         (sdk_py_root / "stonegate_api" / "__init__.py", api_pkg),
         (sdk_py_root / "stonegate_qec" / "__init__.py", qec_pkg),
+        (sdk_py_root / "stonegate_qec_kernels" / "__init__.py", qec_kernels_pkg),
     ]:
         if _write_if_changed(p, t):
             changed.append(p)
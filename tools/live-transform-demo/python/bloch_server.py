@@ -1,23 +1,47 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import email.message
+import json
+import math
+from typing import Any, Dict, List, Optional
 
 import numpy as np
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.openapi.utils import (
+    get_openapi,
+    validation_error_definition,
+    validation_error_response_definition,
+)
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, ValidationError
+
+from server_common import json_response, run
+
+try:
+    import msgspec
+except ImportError:  # optional: faster request decoding
+    msgspec = None
 
 
 def _mean_or_nan(values: List[float]) -> float:
-    if not values:
+    n = len(values)
+    if not n:
         return float("nan")
-    return float(np.mean(np.asarray(values, dtype=float)))
+    if n < 64:
+        # Short windows: exact pure-Python sum, no array allocation or ufunc dispatch.
+        try:
+            return math.fsum(values) / n
+        except (ValueError, OverflowError):
+            pass  # inf - inf / intermediate overflow: let NumPy produce nan/inf
+    return float(np.asarray(values, dtype=np.float64).mean())
 
 
 def _clamp_unit(x: float) -> float:
-    if not np.isfinite(x):
+    if not math.isfinite(x):
         return 0.0
-    return float(max(-1.0, min(1.0, x)))
+    return -1.0 if x < -1.0 else (1.0 if x > 1.0 else float(x))
 
 
 class Series(BaseModel):
@@ -42,6 +66,82 @@ class BlochResponse(BaseModel):
     note: Optional[str] = None
 
 
+# The request body is decoded straight from bytes in one pass: with msgspec when installed,
+# otherwise with pydantic-core's JSON parser (no intermediate dict + model validation).
+# Bodies the fast decoder rejects are decoded again exactly as FastAPI would, so whether
+# msgspec is installed never changes which requests succeed or what a 422 contains.
+if msgspec is not None:
+
+    class _SeriesStruct(msgspec.Struct):
+        deviceId: str
+        metric: str
+        values: List[float] = msgspec.field(default_factory=list)
+
+    class _BlochRequestStruct(msgspec.Struct):
+        x: _SeriesStruct
+        y: _SeriesStruct
+        z: _SeriesStruct
+
+    _msgspec_decode = msgspec.json.Decoder(_BlochRequestStruct, strict=False).decode
+
+
+def _is_json_content_type(value: Optional[str]) -> bool:
+    # FastAPI's rule for parsing a declared body as JSON: application/json or
+    # application/*+json; anything else (or no content-type) is validated as raw bytes.
+    if not value:
+        return False
+    message = email.message.Message()
+    message["content-type"] = value
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+def _loads_json_body(body: bytes) -> Any:
+    # Rejected bodies take FastAPI's own path for a declared body parameter (json.loads,
+    # then model validation), so lax coercions and the 422 details match it exactly.
+    try:
+        return json.loads(body) if body else None
+    except json.JSONDecodeError as e:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", e.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": e.msg},
+                }
+            ]
+        )
+
+
+def _decode_bloch_request(body: bytes, content_type: Optional[str]) -> Any:
+    if not _is_json_content_type(content_type):
+        data: Any = body or None
+    else:
+        if msgspec is not None:
+            try:
+                return _msgspec_decode(body)
+            except msgspec.DecodeError:  # includes msgspec.ValidationError
+                pass
+        else:
+            try:
+                return BlochRequest.model_validate_json(body)
+            except ValidationError:
+                pass
+        data = _loads_json_body(body)
+    if data is None:
+        raise RequestValidationError([{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}])
+    try:
+        return BlochRequest.model_validate(data, from_attributes=True)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
+
+
 app = FastAPI(title="StoneGate Live Transforms (Python)")
 
 # Local tool usage: allow browser tabs to call this server.
@@ -54,13 +154,48 @@ app.add_middleware(
 )
 
 
+def _openapi() -> Dict[str, Any]:
+    # The body is decoded by hand, so register its schema (and FastAPI's 422 error
+    # schemas) for the docs explicitly.
+    if app.openapi_schema is None:
+        schema = get_openapi(title=app.title, version=app.version, routes=app.routes)
+        req = BlochRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        components.update(req.pop("$defs", {}))
+        components["BlochRequest"] = req
+        components["ValidationError"] = validation_error_definition
+        components["HTTPValidationError"] = validation_error_response_definition
+        app.openapi_schema = schema
+    return app.openapi_schema
+
+
+app.openapi = _openapi  # type: ignore[method-assign]
+
+
 @app.get("/health")
 def health() -> dict:
     return {"ok": True}
 
 
-@app.post("/analyze/bloch", response_model=BlochResponse)
-def analyze_bloch(req: BlochRequest) -> BlochResponse:
+@app.post(
+    "/analyze/bloch",
+    responses={
+        200: {"model": BlochResponse},
+        422: {
+            "description": "Validation Error",
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/HTTPValidationError"}}},
+        },
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/BlochRequest"}}},
+        }
+    },
+)
+async def analyze_bloch(request: Request) -> Response:
+    req = _decode_bloch_request(await request.body(), request.headers.get("content-type"))
+
     # Very lightweight example: interpret the *mean* of each series as an
     # estimated Pauli expectation value over the current window.
     x_raw = _mean_or_nan(req.x.values)
@@ -71,16 +206,14 @@ def analyze_bloch(req: BlochRequest) -> BlochResponse:
     y = _clamp_unit(y_raw)
     z = _clamp_unit(z_raw)
 
-    r = float(np.sqrt(x * x + y * y + z * z))
+    r = math.hypot(x, y, z)
 
     note = None
     if r > 1.0:
         note = "vector magnitude > 1 (unexpected); check scaling"
 
-    return BlochResponse(x=x, y=y, z=z, r=r, note=note)
+    return json_response({"x": x, "y": y, "z": z, "r": r, "note": note})
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(app, host="127.0.0.1", port=8765)
+    run(app, port=8765)
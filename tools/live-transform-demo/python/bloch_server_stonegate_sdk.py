@@ -19,14 +19,18 @@ Run:
 Then set External API to http://127.0.0.1:8766 and choose the matching script.
 """
 
+import math
 import time
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
-import numpy as np
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from server_common import json_response, run
+
 try:
     import stonegate_api as sg  # type: ignore
 except Exception as e:  # pragma: no cover
@@ -40,9 +44,9 @@ except Exception as e:  # pragma: no cover
 
 
 def _clamp_unit(x: float) -> float:
-    if not np.isfinite(x):
+    if not math.isfinite(x):
         return 0.0
-    return float(max(-1.0, min(1.0, x)))
+    return -1.0 if x < -1.0 else (1.0 if x > 1.0 else float(x))
 
 
 class AxisSpec(BaseModel):
@@ -66,7 +70,14 @@ class BlochResponse(BaseModel):
     note: Optional[str] = None
 
 
-app = FastAPI(title="StoneGate Live Transforms (Python, stonegate_api)")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # stonegate_api keeps one WebSocket per backend URL open across requests; close them here.
+    await sg.close()
+
+
+app = FastAPI(title="StoneGate Live Transforms (Python, stonegate_api)", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -82,8 +93,9 @@ def health() -> dict:
     return {"ok": True}
 
 
-@app.post("/analyze/bloch_from_sdk", response_model=BlochResponse)
-async def analyze_bloch_from_sdk(req: BlochFromSdkRequest) -> BlochResponse:
+@app.post("/analyze/bloch_from_sdk", responses={200: {"model": BlochResponse}})
+async def analyze_bloch_from_sdk(req: BlochFromSdkRequest) -> Response:
+    # Selects the pooled connection for this URL (opened on first use, then reused).
     sg.WS_URL = str(req.wsUrl)
 
     snap = await sg.poll_all_flat()
@@ -102,16 +114,14 @@ async def analyze_bloch_from_sdk(req: BlochFromSdkRequest) -> BlochResponse:
     x = _clamp_unit(x_raw)
     y = _clamp_unit(y_raw)
     z = _clamp_unit(z_raw)
-    r = float(np.sqrt(x * x + y * y + z * z))
+    r = math.hypot(x, y, z)
 
     note = None
-    if not np.isfinite(x_raw) or not np.isfinite(y_raw) or not np.isfinite(z_raw):
+    if not math.isfinite(x_raw) or not math.isfinite(y_raw) or not math.isfinite(z_raw):
         note = "missing/non-numeric axis values (check deviceId/metric)"
 
-    return BlochResponse(x=x, y=y, z=z, r=r, ts_ms=int(time.time() * 1000), note=note)
+    return json_response({"x": x, "y": y, "z": z, "r": r, "ts_ms": int(time.time() * 1000), "note": note})
 
 
 if __name__ == "__main__":
-    import uvicorn
-
-    uvicorn.run(app, host="127.0.0.1", port=8766)
+    run(app, port=8766)
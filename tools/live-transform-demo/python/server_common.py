@@ -0,0 +1,46 @@
+"""Helpers shared by the live-transform demo servers (`bloch_server*.py`)."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional: faster response encoding
+    orjson = None
+
+
+def json_response(content: Dict[str, Any]) -> Response:
+    # Encoded once, here: returning a Response skips FastAPI's response_model
+    # validation + jsonable_encoder pass. The route's response model still documents the schema.
+    if orjson is not None:
+        body = orjson.dumps(content)
+    else:
+        body = json.dumps(content, separators=(",", ":")).encode()
+    return Response(content=body, media_type="application/json")
+
+
+def run(app: Any, *, port: int) -> None:
+    """Serve `app` on 127.0.0.1:`port` with uvicorn."""
+
+    import uvicorn
+
+    # uvloop (libuv event loop) and httptools (C HTTP parser) ship with uvicorn[standard];
+    # fall back to asyncio/h11 where they are unavailable (e.g. uvloop on Windows).
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+
+    uvicorn.run(app, host="127.0.0.1", port=port, loop=loop, http=http, access_log=False)
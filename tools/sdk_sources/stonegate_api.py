@@ -2,6 +2,8 @@
 
 This module is intentionally small and dependency-light.
 - Requires: `pip install websockets`
+- Optional: `pip install orjson` (faster JSON encode/decode on the RPC path)
+- Optional: `pip install numpy` (vectorized fitting helpers)
 - Protocol: JSON-RPC over WebSocket as implemented by StoneGate backend.
 
 Generated scripts/notebooks can do:
@@ -10,40 +12,174 @@ Generated scripts/notebooks can do:
     sg.WS_URL = 'ws://localhost:8080/status'
 
 and then use `await sg.device_action(...)`, `await sg.wait_for_stable(...)`, etc.
+
+RPCs share one WebSocket per (event loop, URL); replies are matched to callers
+by request id. Call `await sg.close()` to drop the connection explicitly.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+import operator
 import uuid
-from typing import Any, Dict, Optional, Set
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
 
 import websockets
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
 WS_URL = "ws://localhost:8080/status"
 
 
+def _json_dumps(obj: Any) -> str:
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: Any) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
 async def list_devices() -> Dict[str, Any]:
     return await rpc("devices.list", {})
 
 
+class _RpcConnection:
+    """A lazily-opened WebSocket shared by all `rpc()` calls for one URL."""
+
+    def __init__(self, url: str, loop: asyncio.AbstractEventLoop) -> None:
+        self.url = url
+        self.loop = loop
+        self._ws: Any = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        # Methods this backend rejected as unknown -> its error payload, so fallbacks
+        # don't pay a failing round-trip on every call. Reset with each new socket.
+        self.unsupported: Dict[str, Any] = {}
+
+    async def open(self) -> Tuple[Any, Dict[str, asyncio.Future]]:
+        if self._ws is None:
+            async with self._lock:
+                if self._ws is None:
+                    ws = await websockets.connect(self.url)
+                    pending: Dict[str, asyncio.Future] = {}
+                    self._ws, self._pending = ws, pending
+                    self.unsupported = {}
+                    self._reader = asyncio.create_task(self._read_loop(ws, pending))
+        return self._ws, self._pending
+
+    async def _read_loop(self, ws: Any, pending: Dict[str, asyncio.Future]) -> None:
+        try:
+            async for raw in ws:
+                try:
+                    msg = _json_loads(raw)
+                except Exception:
+                    continue
+                if not isinstance(msg, dict) or msg.get("type") != "rpc_result":
+                    continue
+                fut = pending.pop(msg.get("id"), None)
+                if fut is not None and not fut.done():
+                    fut.set_result(msg)
+        except asyncio.CancelledError:
+            # Loop shutdown (e.g. end of asyncio.run()): drop the socket without a close handshake.
+            transport = getattr(ws, "transport", None)
+            if transport is not None:
+                transport.abort()
+            raise
+        except Exception:
+            pass
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            for fut in pending.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError(f"WebSocket closed: {self.url}"))
+            pending.clear()
+
+    async def close(self) -> None:
+        ws, reader = self._ws, self._reader
+        self._ws, self._reader = None, None
+        if ws is not None:
+            await ws.close()
+        if reader is not None:
+            reader.cancel()
+
+
+_connections: Dict[str, _RpcConnection] = {}
+
+
+def _connection() -> _RpcConnection:
+    loop = asyncio.get_running_loop()
+    conn = _connections.get(WS_URL)
+    # A connection is bound to the loop that opened it (e.g. one per asyncio.run()).
+    if conn is None or conn.loop is not loop:
+        conn = _RpcConnection(WS_URL, loop)
+        _connections[WS_URL] = conn
+    return conn
+
+
+async def close() -> None:
+    """Close any shared RPC connections opened from the running event loop."""
+
+    loop = asyncio.get_running_loop()
+    for url, conn in list(_connections.items()):
+        if conn.loop is loop:
+            del _connections[url]
+            await conn.close()
+
+
 async def rpc(method: str, params: Optional[Dict[str, Any]] = None, timeout_s: float = 10.0) -> Any:
     rid = f"py_{uuid.uuid4().hex}"
     req = {"type": "rpc", "id": rid, "method": method, "params": params or {}}
-    async with websockets.connect(WS_URL) as ws:
-        await ws.send(json.dumps(req))
-        loop = asyncio.get_running_loop()
-        deadline = loop.time() + float(timeout_s)
-        while True:
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                raise TimeoutError(f"RPC timeout: {method}")
-            msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=remaining))
-            if msg.get("type") == "rpc_result" and msg.get("id") == rid:
-                if not msg.get("ok", False):
-                    raise RuntimeError(msg.get("error"))
-                return msg.get("result")
+    conn = _connection()
+    ws, pending = await conn.open()
+    if method in conn.unsupported:
+        raise RuntimeError(conn.unsupported[method])
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    pending[rid] = fut
+    try:
+        await ws.send(_json_dumps(req))
+        msg = await asyncio.wait_for(fut, timeout=float(timeout_s))
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"RPC timeout: {method}") from None
+    finally:
+        pending.pop(rid, None)
+    if not msg.get("ok", False):
+        err = RuntimeError(msg.get("error"))
+        if is_unknown_method_error(err):
+            conn.unsupported[method] = msg.get("error")
+        raise err
+    return msg.get("result")
+
+
+def is_unknown_method_error(err: BaseException) -> bool:
+    """True if `err` is the backend's rejection of an RPC method it does not implement.
+
+    Lets helpers prefer newer batched/targeted RPCs and fall back on older backends.
+    """
+
+    info = err.args[0] if err.args else None
+    details = info.get("details") if isinstance(info, dict) else None
+    return isinstance(details, dict) and details.get("detail") == "unknown rpc method"
+
+
+def _flatten_measurement(meas: Any) -> Dict[str, Any]:
+    if isinstance(meas, dict) and "measurements" in meas and isinstance(meas.get("measurements"), dict):
+        inner = meas.get("measurements")
+        return {k: (v.get("value") if isinstance(v, dict) and "value" in v else v) for k, v in inner.items()}
+    if isinstance(meas, dict):
+        return {k: (v.get("value") if isinstance(v, dict) and "value" in v else v) for k, v in meas.items()}
+    return {}
 
 
 async def poll_all_flat() -> Dict[str, Dict[str, Any]]:
@@ -51,19 +187,23 @@ async def poll_all_flat() -> Dict[str, Dict[str, Any]]:
     out: Dict[str, Dict[str, Any]] = {}
     for u in r.get("updates", []):
         did = u.get("id")
-        meas = u.get("measurement") or {}
-        if isinstance(meas, dict) and "measurements" in meas and isinstance(meas.get("measurements"), dict):
-            inner = meas.get("measurements")
-            flat = {k: (v.get("value") if isinstance(v, dict) and "value" in v else v) for k, v in inner.items()}
-        elif isinstance(meas, dict):
-            flat = {k: (v.get("value") if isinstance(v, dict) and "value" in v else v) for k, v in meas.items()}
-        else:
-            flat = {}
         if isinstance(did, str):
-            out[did] = flat
+            out[did] = _flatten_measurement(u.get("measurement") or {})
     return out
 
 
+async def poll_device_flat(device_id: str) -> Dict[str, Any]:
+    """Flat {metric: value} for one device ({} if unknown), without the all-device snapshot."""
+
+    try:
+        r = await rpc("device.get", {"device_id": device_id})
+    except RuntimeError as e:
+        if not is_unknown_method_error(e):
+            return {}
+        return (await poll_all_flat()).get(device_id) or {}
+    return _flatten_measurement((r or {}).get("measurement") or {})
+
+
 async def device_action(device_id: str, action: Dict[str, Any]) -> Any:
     return await rpc("device.action", {"device_id": device_id, "action": action}, timeout_s=20.0)
 
@@ -91,27 +231,54 @@ async def record_stop(recording_id: str) -> Any:
     return await rpc("record.stop", {"recording_id": recording_id}, timeout_s=20.0)
 
 
+_OPS: Dict[str, Callable[[float, float], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+def compile_condition(op: str, value: float) -> Callable[[Optional[float]], bool]:
+    """Resolve `op` once and return a predicate for `latest <op> value`.
+
+    Use this instead of `eval_condition` when the same condition is checked in a loop.
+    """
+
+    try:
+        cmp = _OPS[op]
+    except KeyError:
+        raise ValueError(f"Unknown op: {op}") from None
+
+    def check(latest: Optional[float]) -> bool:
+        return latest is not None and cmp(latest, value)
+
+    return check
+
+
 def eval_condition(latest: Optional[float], op: str, value: float) -> bool:
     if latest is None:
         return False
-    if op == "<":
-        return latest < value
-    if op == "<=":
-        return latest <= value
-    if op == ">":
-        return latest > value
-    if op == ">=":
-        return latest >= value
-    if op == "==":
-        return latest == value
-    if op == "!=":
-        return latest != value
-    raise ValueError(f"Unknown op: {op}")
+    try:
+        cmp = _OPS[op]
+    except KeyError:
+        raise ValueError(f"Unknown op: {op}") from None
+    return cmp(latest, value)
 
 
 async def get_latest_number(device_id: str, metric: str) -> Optional[float]:
-    snap = await poll_all_flat()
-    v = (snap.get(device_id) or {}).get(metric)
+    # `device.get` returns just this one value; older backends only have the full `devices.poll` snapshot.
+    try:
+        r = await rpc("device.get", {"device_id": device_id, "metric": metric})
+    except RuntimeError as e:
+        if not is_unknown_method_error(e):
+            return None
+        snap = await poll_all_flat()
+        v = (snap.get(device_id) or {}).get(metric)
+    else:
+        v = (r or {}).get("value")
     try:
         return float(v)  # type: ignore[arg-type]
     except Exception:
@@ -125,10 +292,27 @@ async def poll_required_number(device_id: str, metric: str) -> float:
     return float(v)
 
 
+# estimate_leak_rate_per_s fits with NumPy from this many samples up; below it the
+# pure-Python fit is as fast and skips the ~50 ms NumPy import.
+_LEAK_FIT_NUMPY_MIN_SAMPLES = 512
+
+
+@functools.cache
+def _numpy() -> Any:
+    """NumPy, imported on first use; None when not installed."""
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return numpy
+
+
 def estimate_leak_rate_per_s(samples: list[tuple[float, float]], p_atm_kpa: float = 101.3) -> float | None:
     """Estimate k from P(t) - P_atm = (P0 - P_atm) * exp(-k t).
 
-    Uses a simple least-squares fit in log-space.
+    Uses a simple least-squares fit in log-space (vectorized with NumPy for long
+    sample lists when installed).
     """
 
     import math
@@ -137,31 +321,47 @@ def estimate_leak_rate_per_s(samples: list[tuple[float, float]], p_atm_kpa: floa
         return None
 
     t0 = samples[0][0]
-    xs: list[float] = []
-    ys: list[float] = []
     dp0 = samples[0][1] - p_atm_kpa
     if dp0 == 0:
         return None
 
-    for t, p in samples:
-        dp = p - p_atm_kpa
+    np = _numpy() if len(samples) >= _LEAK_FIT_NUMPY_MIN_SAMPLES else None
+    if np is not None:
+        arr = np.asarray(samples, dtype=np.float64)
+        dp = arr[:, 1] - p_atm_kpa
         # Require same sign to keep log well-defined.
-        if dp == 0 or (dp > 0) != (dp0 > 0):
-            continue
-        xs.append(t - t0)
-        ys.append(math.log(abs(dp)))
-
-    if len(xs) < 3:
-        return None
-
-    # Fit y = a + b x; then k = -b
-    xbar = sum(xs) / len(xs)
-    ybar = sum(ys) / len(ys)
-    num = sum((x - xbar) * (y - ybar) for x, y in zip(xs, ys))
-    den = sum((x - xbar) ** 2 for x in xs)
-    if den == 0:
-        return None
-    b = num / den
+        mask = (dp != 0) & ((dp > 0) == (dp0 > 0))
+        if int(mask.sum()) < 3:
+            return None
+        xs_a = arr[mask, 0] - t0
+        ys_a = np.log(np.abs(dp[mask]))
+        xc = xs_a - xs_a.mean()
+        den = float(xc @ xc)
+        if den == 0:
+            return None
+        b = float(xc @ (ys_a - ys_a.mean())) / den
+    else:
+        xs: list[float] = []
+        ys: list[float] = []
+        for t, p in samples:
+            dp = p - p_atm_kpa
+            # Require same sign to keep log well-defined.
+            if dp == 0 or (dp > 0) != (dp0 > 0):
+                continue
+            xs.append(t - t0)
+            ys.append(math.log(abs(dp)))
+
+        if len(xs) < 3:
+            return None
+
+        # Fit y = a + b x; then k = -b
+        xbar = sum(xs) / len(xs)
+        ybar = sum(ys) / len(ys)
+        num = sum((x - xbar) * (y - ybar) for x, y in zip(xs, ys))
+        den = sum((x - xbar) ** 2 for x in xs)
+        if den == 0:
+            return None
+        b = num / den
     k = -b
     if not math.isfinite(k) or k < 0:
         return None
@@ -176,27 +376,76 @@ async def wait_for_stable(
     consecutive: int,
     timeout_s: float,
 ) -> None:
-    start = asyncio.get_running_loop().time()
+    loop = asyncio.get_running_loop()
+    window_s = float(window_s)
+    timeout_s = float(timeout_s)
+    tolerance = float(tolerance)
+    consecutive = int(consecutive)
+
+    # Prefer the backend-side check: one `device.watch` reply instead of a poll per sample.
+    # The backend caps a single watch and echoes the `timeout_s` it used; keep re-issuing
+    # for whatever is left of our own timeout.
+    deadline = loop.time() + timeout_s
+    try:
+        while True:
+            remaining = max(0.0, deadline - loop.time())
+            r = await rpc(
+                "device.watch",
+                {
+                    "device_id": device_id,
+                    "metric": metric,
+                    "tolerance": tolerance,
+                    "window_s": window_s,
+                    "consecutive": consecutive,
+                    "timeout_s": remaining,
+                },
+                timeout_s=remaining + 10.0,
+            )
+            r = r or {}
+            if r.get("stable"):
+                return
+            if float(r.get("timeout_s", remaining)) >= remaining:
+                break
+    except RuntimeError:
+        # Older backend (no `device.watch`) or rejected params (e.g. unknown device):
+        # use the client-side loop, which times out as it always has.
+        pass
+    else:
+        raise TimeoutError(f"wait_for_stable timeout: {device_id}:{metric}")
+
+    poll_s = min(0.5, max(0.05, window_s / 4))
+    start = loop.time()
     ok = 0
-    samples: list[float] = []
-    ts: list[float] = []
-    while (asyncio.get_running_loop().time() - start) < float(timeout_s):
+    # Sliding window of sample timestamps, plus monotonic deques of (t, v) whose
+    # fronts hold the window max/min (amortized O(1) per sample).
+    ts: Deque[float] = deque()
+    maxq: Deque[Tuple[float, float]] = deque()
+    minq: Deque[Tuple[float, float]] = deque()
+    while (loop.time() - start) < timeout_s:
         v = await get_latest_number(device_id, metric)
-        now = asyncio.get_running_loop().time()
+        now = loop.time()
         if v is not None:
-            samples.append(v)
             ts.append(now)
-        while ts and (now - ts[0]) > float(window_s):
-            ts.pop(0)
-            samples.pop(0)
-        if len(samples) >= 2:
-            if abs(max(samples) - min(samples)) <= float(tolerance):
+            while maxq and maxq[-1][1] <= v:
+                maxq.pop()
+            maxq.append((now, v))
+            while minq and minq[-1][1] >= v:
+                minq.pop()
+            minq.append((now, v))
+        while ts and (now - ts[0]) > window_s:
+            ts.popleft()
+        while maxq and (now - maxq[0][0]) > window_s:
+            maxq.popleft()
+        while minq and (now - minq[0][0]) > window_s:
+            minq.popleft()
+        if len(ts) >= 2:
+            if abs(maxq[0][1] - minq[0][1]) <= tolerance:
                 ok += 1
             else:
                 ok = 0
-            if ok >= int(consecutive):
+            if ok >= consecutive:
                 return
-        await asyncio.sleep(min(0.5, max(0.05, float(window_s) / 4)))
+        await asyncio.sleep(poll_s)
     raise TimeoutError(f"wait_for_stable timeout: {device_id}:{metric}")
 
 
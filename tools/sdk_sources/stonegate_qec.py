@@ -14,29 +14,173 @@ This file therefore focuses on:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import asyncio
+import functools
 import math
 import random
 
-import stonegate_api as sg
+
+def _sg() -> Any:
+    """The `stonegate_api` module, imported on first use.
+
+    Only the async helpers talk to the backend; importing this module for the decoders,
+    Monte Carlo or rounds mapping alone does not pull in `stonegate_api` or websockets.
+    """
+
+    import stonegate_api
+
+    return stonegate_api
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: `stonegate_qec.sg` still resolves to the `stonegate_api` module itself.
+    if name == "sg":
+        return _sg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _numpy() -> Any:
+    """NumPy, imported on first use; None when not installed.
+
+    Importing NumPy costs ~50 ms, so the helpers below only call this for inputs of at
+    least `_NUMPY_MIN_ELEMS` elements (or when handed NumPy objects).
+    """
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return numpy
+
 
 Measurement = Dict[str, Any]
 
 
+@dataclass
+class PackedMeasurements:
+    """Repetition-code syndrome bits for one (qubit, basis), packed into an int.
+
+    Bit `r` of `packed` is the value of round `r`; `n` is the number of rounds. Up to 64
+    rounds this is a single machine word; Python ints keep longer runs exact.
+    """
+
+    qubit: int
+    basis: str
+    packed: int
+    n: int
+
+    @classmethod
+    def from_bits(cls, *, qubit: int, basis: str, bits: Sequence[Any]) -> "PackedMeasurements":
+        packed = 0
+        for r, v in enumerate(bits):
+            if _bit(v):
+                packed |= 1 << r
+        return cls(qubit=int(qubit), basis=str(basis), packed=packed, n=len(bits))
+
+    def to_dict_list(self) -> List[Measurement]:
+        """Expand to `Measurement` dicts (e.g. for `decode_via_rpc`)."""
+
+        q, b, x = self.qubit, self.basis, self.packed
+        return [{"qubit": q, "basis": b, "round": r, "value": (x >> r) & 1} for r in range(self.n)]
+
+
+# Inputs (trials*rounds, rounds, or bits) below this size take the pure-Python paths
+# without importing NumPy; from here up the vectorised paths repay the import.
+_NUMPY_MIN_ELEMS = 1 << 18
+# Upper bound on trials*rounds booleans sampled at once by the NumPy Monte Carlo path.
+_MC_CHUNK_ELEMS = 1 << 22
+# Below this flip probability the NumPy path samples float64 instead of float32.
+_MC_FLOAT32_MIN_P = 2.0 ** -10
+# Inputs (trials*rounds, or bits) below this size never load the Numba kernels: importing
+# Numba and the cached kernels costs ~0.3 s, which the NumPy path only loses to the
+# kernel at tens of millions of elements.
+_KERNEL_MIN_ELEMS = 1 << 24
+# Rows at least this long are counted by packing to bytes and popcounting; shorter
+# rows are cheaper to sum directly.
+_POPCOUNT_MIN_ROUNDS = 512
+
+
+def _bit(v: Any) -> int:
+    try:
+        return 1 if int(v) != 0 else 0
+    except Exception:
+        return 0
+
+
+def _kernels(n: int) -> Any:
+    """`stonegate_qec_kernels` for an input of `n` elements, or None.
+
+    None below `_KERNEL_MIN_ELEMS` or when Numba is not installed. Depends only on `n`,
+    not on what ran earlier, so a seeded call always takes the same path.
+    """
+
+    if n < _KERNEL_MIN_ELEMS:
+        return None
+    try:
+        import stonegate_qec_kernels
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return stonegate_qec_kernels
+
+
+def _count_ones_per_row(np: Any, flips: Any) -> Any:
+    """Per-row number of True values in a 2-D boolean array."""
+
+    # np.bitwise_count (hardware popcount) is NumPy >= 2.0.
+    bitwise_count = getattr(np, "bitwise_count", None)
+    if bitwise_count is not None and flips.shape[1] >= _POPCOUNT_MIN_ROUNDS:
+        return bitwise_count(np.packbits(flips, axis=1)).sum(axis=1, dtype=np.int32)
+    return flips.sum(axis=1, dtype=np.int32)
+
+
 def repetition_decode_majority(measurements: Sequence[Measurement]) -> int:
     """Toy repetition-code decoder: majority vote over 'value' bits."""
 
-    bits: List[int] = []
-    for m in measurements:
-        try:
-            bits.append(1 if int(m.get("value", 0)) != 0 else 0)
-        except Exception:
-            bits.append(0)
-    if not bits:
+    n = len(measurements)
+    if n == 0:
         return 0
-    ones = sum(bits)
-    return 1 if ones > (len(bits) / 2.0) else 0
+    try:
+        # Backend values are already ints: no per-item try/except on the common path.
+        ones = len([m for m in measurements if int(m["value"])])
+    except Exception:
+        ones = sum(_bit(m.get("value", 0)) for m in measurements)
+    return 1 if 2 * ones > n else 0
+
+
+def repetition_decode_majority_bits(bits: Sequence[int]) -> int:
+    """Majority vote over raw 0/1 values (e.g. `qec.acquire_repetition` `values`).
+
+    Skips the per-measurement dict layer; for arrays and long inputs with NumPy the vote
+    runs over one uint8 buffer (through a Numba kernel for very long inputs when installed).
+    """
+
+    n = len(bits)
+    if n == 0:
+        return 0
+    np = _numpy() if n >= _NUMPY_MIN_ELEMS or hasattr(bits, "dtype") else None
+    if np is None:
+        ones = sum(map(_bit, bits))
+        return 1 if 2 * ones > n else 0
+    arr = np.asarray(bits)
+    if arr.dtype.kind in "biu":
+        arr = (arr != 0).view(np.uint8)
+    else:
+        # Floats, None, strings, ...: same per-value rule as the dict decoder (`_bit`).
+        arr = np.fromiter(map(_bit, bits), dtype=np.uint8, count=n)
+    k = _kernels(n)
+    if k is not None:
+        return int(k.majority_u8(arr))
+    return 1 if 2 * int(np.count_nonzero(arr)) > n else 0
+
+
+def repetition_decode_majority_packed(pm: PackedMeasurements) -> int:
+    """Majority vote over `PackedMeasurements` (one popcount)."""
+
+    return 1 if pm.packed.bit_count() * 2 > pm.n else 0
 
 
 def repetition_measurements(
@@ -46,35 +190,106 @@ def repetition_measurements(
     rounds: int,
     qubit: int = 0,
     basis: str = "Z",
-    rng: Optional[random.Random] = None,
+    rng: Optional[Any] = None,
 ) -> List[Measurement]:
-    """Generate synthetic repetition-code measurements (pure Python demo)."""
+    """Generate synthetic repetition-code measurements (demo).
 
-    r = rng or random.Random()
-    out: List[Measurement] = []
+    `rng` may be a `random.Random` or a `numpy.random.Generator`. With NumPy, a Generator
+    (or `rounds` >= `_NUMPY_MIN_ELEMS`) samples all flips in one call; a `random.Random`
+    then seeds the Generator, so seeded runs stay reproducible.
+    """
+
+    n = int(rounds)
     tb = 1 if int(true_bit) != 0 else 0
     p = float(p_flip)
     p = max(0.0, min(1.0, p))
-    for i in range(int(rounds)):
-        bit = tb
-        if r.random() < p:
-            bit ^= 1
-        out.append(make_measurement(qubit=qubit, basis=basis, round=i, value=bit))
-    return out
+    q, b = int(qubit), str(basis)
+    np = _numpy() if n >= _NUMPY_MIN_ELEMS or type(rng).__module__.startswith("numpy") else None
+    if np is not None and (isinstance(rng, np.random.Generator) or n >= _NUMPY_MIN_ELEMS):
+        if isinstance(rng, np.random.Generator):
+            g = rng
+        else:
+            g = np.random.default_rng((rng or random.Random()).getrandbits(64))
+        dtype = np.float32 if p >= _MC_FLOAT32_MIN_P else np.float64
+        bits = ((g.random(max(0, n), dtype=dtype) < p) ^ bool(tb)).view(np.uint8).tolist()
+    else:
+        r = rng or random.Random()
+        bits = [tb ^ 1 if r.random() < p else tb for _ in range(n)]
+    return [{"qubit": q, "basis": b, "round": i, "value": v} for i, v in enumerate(bits)]
 
 
 def logical_error_rate_repetition(*, trials: int, p_flip: float, rounds: int, seed: Optional[int] = None) -> float:
-    """Estimate logical error rate for a repetition code using majority vote."""
+    """Estimate logical error rate for a repetition code using majority vote.
+
+    The true bit is 0, so a trial fails when more than half of the `rounds` bits flip.
+    From `_KERNEL_MIN_ELEMS` trials*rounds up this runs a parallel Numba kernel when Numba
+    is installed, and from `_NUMPY_MIN_ELEMS` up NumPy when installed; otherwise pure
+    Python (same estimator; each path draws from its own random stream, and the path
+    depends only on the sizes).
+    """
+
+    n_trials = int(trials)
+    n_rounds = int(rounds)
+    p = max(0.0, min(1.0, float(p_flip)))
+    if n_trials <= 0:
+        return 0.0
 
-    r = random.Random(seed)
     errs = 0
-    for _ in range(int(trials)):
-        true_bit = 0
-        meas = repetition_measurements(true_bit=true_bit, p_flip=p_flip, rounds=rounds, rng=r)
-        dec = repetition_decode_majority(meas)
-        if dec != true_bit:
-            errs += 1
-    return float(errs) / max(1, int(trials))
+    elems = n_trials * n_rounds
+    k = _kernels(elems)
+    np = _numpy() if k is None and elems >= _NUMPY_MIN_ELEMS else None
+    if k is not None:
+        errs = int(k.lerr_kernel(n_trials, n_rounds, p, k.seed64(seed)))
+    elif np is not None:
+        rng = np.random.default_rng(seed)
+        # float32 uniforms halve the bytes generated and compared; their 2**-24 grid only
+        # matters for tiny p, which keeps float64.
+        dtype = np.float32 if p >= _MC_FLOAT32_MIN_P else np.float64
+        step = max(1, _MC_CHUNK_ELEMS // max(1, n_rounds))
+        for start in range(0, n_trials, step):
+            flips = rng.random((min(step, n_trials - start), n_rounds), dtype=dtype) < p
+            errs += int(np.count_nonzero(2 * _count_ones_per_row(np, flips) > n_rounds))
+    else:
+        r = random.Random(seed)
+        rand = r.random
+        for _ in range(n_trials):
+            ones = 0
+            for _ in range(n_rounds):
+                if rand() < p:
+                    ones += 1
+            if 2 * ones > n_rounds:
+                errs += 1
+    return float(errs) / n_trials
+
+
+# p_flip range mapped linearly onto [min_rounds..max_rounds] by the rounds helpers.
+_ROUNDS_P_LO = 0.01
+_ROUNDS_P_SPAN = 0.35 - 0.01
+
+
+def _rounds_for_p(p: float, min_rounds: int, max_rounds: int) -> int:
+    x = (p - _ROUNDS_P_LO) / _ROUNDS_P_SPAN
+    x = max(0.0, min(1.0, x))
+    r = int(round(min_rounds + (max_rounds - min_rounds) * x))
+    return max(min_rounds, min(max_rounds, r))
+
+
+def choose_repetition_rounds_array(p: Any, min_rounds: int = 3, max_rounds: int = 9) -> Any:
+    """Vectorized p_flip -> rounds mapping for parameter sweeps.
+
+    Same result as the scalar helpers for every element of `p`. Returns an int32 array
+    with NumPy, else a list.
+    """
+
+    lo, hi = int(min_rounds), int(max_rounds)
+    np = _numpy()
+    if np is None:
+        return [_rounds_for_p(float(v), lo, hi) for v in p]
+    x = (np.asarray(p, dtype=np.float64) - _ROUNDS_P_LO) / _ROUNDS_P_SPAN
+    # fmin/fmax (not clip) so NaN maps like the scalar max(0.0, min(1.0, x)), i.e. to 1.0.
+    x = np.fmax(np.fmin(x, 1.0), 0.0)
+    # np.rint rounds half to even, like round() in _rounds_for_p.
+    return np.clip(np.rint(lo + (hi - lo) * x), lo, hi).astype(np.int32)
 
 
 def p_flip_from_temperature(*, temperature_K: float) -> float:
@@ -93,11 +308,7 @@ def choose_repetition_rounds(*, temperature_K: float, min_rounds: int = 3, max_r
     """Choose rounds from a temperature-derived p_flip (demo helper)."""
 
     p = p_flip_from_temperature(temperature_K=temperature_K)
-    # Map p in [0.01..0.35] to [min..max].
-    x = (p - 0.01) / max(1e-9, (0.35 - 0.01))
-    x = max(0.0, min(1.0, x))
-    r = int(round(min_rounds + (max_rounds - min_rounds) * x))
-    return max(int(min_rounds), min(int(max_rounds), r))
+    return _rounds_for_p(p, int(min_rounds), int(max_rounds))
 
 
 async def decode_via_rpc(
@@ -111,7 +322,7 @@ async def decode_via_rpc(
 
     params: Dict[str, Any] = {"code": code, "measurements": list(measurements)}
     params.update(extra_params)
-    return await sg.rpc("qec.decode", params, timeout_s=timeout_s)
+    return await _sg().rpc("qec.decode", params, timeout_s=timeout_s)
 
 
 async def benchmark_via_rpc(
@@ -127,7 +338,8 @@ async def benchmark_via_rpc(
 ) -> Any:
     """Call the backend `qec.benchmark` RPC.
 
-    If `p_flip` is omitted, this will try to read it from `qec_device_id` via `devices.poll`.
+    If `p_flip` is omitted, it is read from `qec_device_id`'s current status
+    (`read_noise_estimate`).
     """
 
     if p_flip is None:
@@ -145,7 +357,54 @@ async def benchmark_via_rpc(
     if params is not None:
         req["params"] = dict(params)
 
-    return await sg.rpc("qec.benchmark", req, timeout_s=timeout_s)
+    try:
+        return await _sg().rpc("qec.benchmark", req, timeout_s=timeout_s)
+    except RuntimeError as e:
+        # Backends without `qec.benchmark`: the repetition benchmark can run locally.
+        if str(code) != "repetition" or not _sg().is_unknown_method_error(e):
+            raise
+    return await benchmark_repetition_local(p_flip=float(p_flip), rounds=rounds, shots=shots, seed=seed)
+
+
+def _benchmark_repetition_rate(n_shots: int, n_rounds: int, p: float, seed: Optional[int]) -> float:
+    # Worker-thread body of benchmark_repetition_local: the serial GIL-free kernel, not
+    # the parallel one, otherwise the same paths as logical_error_rate_repetition.
+    k = _kernels(n_shots * n_rounds)
+    if k is not None:
+        return int(k.lerr_kernel_nogil(n_shots, n_rounds, p, k.seed64(seed))) / n_shots
+    return logical_error_rate_repetition(trials=n_shots, p_flip=p, rounds=n_rounds, seed=seed)
+
+
+async def benchmark_repetition_local(
+    *,
+    p_flip: float,
+    rounds: int = 3,
+    shots: int = 1000,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Repetition-code benchmark computed in-process (offline use, or backends without `qec.benchmark`).
+
+    Runs the Monte Carlo in a worker thread so the event loop stays responsive (large runs
+    use the GIL-free Numba kernel when installed), and returns the same shape as the
+    backend `qec.benchmark` result.
+    """
+
+    p = max(0.0, min(1.0, float(p_flip)))
+    n_rounds = max(1, int(rounds))
+    n_shots = max(1, int(shots))
+    rate = await asyncio.to_thread(_benchmark_repetition_rate, n_shots, n_rounds, p, seed)
+    return {
+        "job_id": "local",
+        "status": "done",
+        "statistics": {
+            "shots": n_shots,
+            "rounds": n_rounds,
+            "p_flip": p,
+            "raw_error_rate": p,
+            "decoded_error_rate": rate,
+            "code": "repetition",
+        },
+    }
 
 
 async def benchmark_repetition_from_hardware(
@@ -202,11 +461,11 @@ async def syndrome_stream_start(
     code_type: str = "repetition",
     rate_hz: float = 10.0,
 ) -> None:
-    await sg.device_action(device_id, {"set_code_type": str(code_type), "set_rate_hz": float(rate_hz), "start": True})
+    await _sg().device_action(device_id, {"set_code_type": str(code_type), "set_rate_hz": float(rate_hz), "start": True})
 
 
 async def syndrome_stream_stop(*, device_id: str = "syn0") -> None:
-    await sg.device_action(device_id, {"stop": True})
+    await _sg().device_action(device_id, {"stop": True})
 
 
 async def noise_spectrometer_scan(
@@ -215,7 +474,7 @@ async def noise_spectrometer_scan(
     band_hz: float = 2000.0,
     duration_s: float = 0.5,
 ) -> None:
-    await sg.device_action(device_id, {"set_band_hz": float(band_hz), "set_duration_s": float(duration_s), "run_scan": True})
+    await _sg().device_action(device_id, {"set_band_hz": float(band_hz), "set_duration_s": float(duration_s), "run_scan": True})
 
 
 async def readout_calibrate(
@@ -224,7 +483,7 @@ async def readout_calibrate(
     target_device: str = "det0",
     samples: int = 500,
 ) -> None:
-    await sg.device_action(device_id, {"set_target_device": str(target_device), "set_samples": int(samples), "calibrate": True})
+    await _sg().device_action(device_id, {"set_target_device": str(target_device), "set_samples": int(samples), "calibrate": True})
 
 
 async def fault_inject_set_env(
@@ -245,7 +504,7 @@ async def fault_inject_set_env(
     if vibration_rms is not None:
         patch["vibration_rms"] = float(vibration_rms)
     if patch:
-        await sg.device_action(device_id, {"set_env": patch})
+        await _sg().device_action(device_id, {"set_env": patch})
 
 
 async def fault_inject_override_device(
@@ -254,11 +513,11 @@ async def fault_inject_override_device(
     target_device_id: str,
     override: Dict[str, Any],
 ) -> None:
-    await sg.device_action(device_id, {"override_device": {"device_id": str(target_device_id), "override": dict(override)}})
+    await _sg().device_action(device_id, {"override_device": {"device_id": str(target_device_id), "override": dict(override)}})
 
 
 async def fault_inject_clear_overrides(*, device_id: str = "fault0") -> None:
-    await sg.device_action(device_id, {"clear_overrides": True})
+    await _sg().device_action(device_id, {"clear_overrides": True})
 
 
 async def leakage_set_fraction(
@@ -267,11 +526,11 @@ async def leakage_set_fraction(
     target_device: str = "qec0",
     leakage_fraction: float,
 ) -> None:
-    await sg.device_action(device_id, {"set_target_device": str(target_device), "set_leakage_fraction": float(leakage_fraction)})
+    await _sg().device_action(device_id, {"set_target_device": str(target_device), "set_leakage_fraction": float(leakage_fraction)})
 
 
 async def leakage_attempt_reset(*, device_id: str = "leak0") -> None:
-    await sg.device_action(device_id, {"attempt_reset": True})
+    await _sg().device_action(device_id, {"attempt_reset": True})
 
 
 async def surface_configure_and_run(
@@ -280,8 +539,8 @@ async def surface_configure_and_run(
     distance: int = 5,
     cycles: int = 25,
 ) -> None:
-    await sg.device_action(device_id, {"configure": {"distance": int(distance)}})
-    await sg.device_action(device_id, {"run_cycles": {"cycles": int(cycles)}})
+    await _sg().device_action(device_id, {"configure": {"distance": int(distance)}})
+    await _sg().device_action(device_id, {"run_cycles": {"cycles": int(cycles)}})
 
 
 async def lattice_surgery_run_demo(
@@ -289,7 +548,7 @@ async def lattice_surgery_run_demo(
     device_id: str = "surg0",
     operation: str = "merge",
 ) -> None:
-    await sg.device_action(device_id, {"set_operation": str(operation), "run_demo": True})
+    await _sg().device_action(device_id, {"set_operation": str(operation), "run_demo": True})
 
 
 async def read_qec_status(
@@ -298,8 +557,7 @@ async def read_qec_status(
 ) -> Dict[str, Any]:
     """Read current QEC-related simulator metrics from the backend."""
 
-    snap = await sg.poll_all_flat()
-    return dict(snap.get(qec_device_id) or {})
+    return dict(await _sg().poll_device_flat(qec_device_id))
 
 
 async def read_noise_estimate(
@@ -333,39 +591,51 @@ async def choose_repetition_rounds_from_hardware(
     _tK, p = await read_noise_estimate(qec_device_id=qec_device_id)
     if p is None:
         return int(min_rounds)
-    # Map p in [0.01..0.35] to [min..max].
-    x = (p - 0.01) / max(1e-9, (0.35 - 0.01))
-    x = max(0.0, min(1.0, x))
-    r = int(round(min_rounds + (max_rounds - min_rounds) * x))
-    return max(int(min_rounds), min(int(max_rounds), r))
+    return _rounds_for_p(p, int(min_rounds), int(max_rounds))
 
 
-async def acquire_repetition_measurements(
-    *,
-    qec_device_id: str = "qec0",
-    rounds: int,
-    qubit: int = 0,
-    basis: str = "Z",
-    set_true_bit: Optional[int] = None,
-    settle_s: float = 0.0,
-) -> List[Measurement]:
-    """Drive the simulator to extract a syndrome bit each round and read it back.
+# Backend cap on `qec.acquire_repetition` rounds per request (SG_QEC_ACQUIRE_MAX_ROUNDS).
+_ACQUIRE_MAX_ROUNDS_PER_RPC = 256
 
-    - Noise is simulated in the backend.
-    - Measurements are read back via `devices.poll` snapshots.
-    """
 
+async def _acquire_repetition_bits_batch(
+    *,
+    qec_device_id: str,
+    rounds: int,
+    set_true_bit: Optional[int],
+) -> List[int]:
+    n = max(0, int(rounds))
+    bits: List[int] = []
+    done = 0
+    while True:
+        chunk = min(n - done, _ACQUIRE_MAX_ROUNDS_PER_RPC)
+        params: Dict[str, Any] = {"device_id": qec_device_id, "rounds": chunk}
+        if set_true_bit is not None and done == 0:
+            params["set_true_bit"] = int(set_true_bit)
+        res = await _sg().rpc("qec.acquire_repetition", params, timeout_s=20.0)
+        bits.extend(1 if int(v) != 0 else 0 for v in (res or {}).get("values") or [])
+        done += chunk
+        if done >= n:
+            return bits
+
+
+async def _acquire_repetition_bits_per_round(
+    *,
+    qec_device_id: str,
+    rounds: int,
+    set_true_bit: Optional[int],
+    settle_s: float,
+) -> List[int]:
+    sg = _sg()
     if set_true_bit is not None:
         await sg.device_action(qec_device_id, {"set_true_bit": int(set_true_bit)})
 
-    out: List[Measurement] = []
-    for r in range(int(rounds)):
+    bits: List[int] = []
+    for _ in range(int(rounds)):
         # Trigger a hardware-like measurement. Backend simulator sets/updates the `syndrome` metric.
         await sg.device_action(qec_device_id, {"extract_syndrome": True})
         if settle_s and settle_s > 0:
             # Optional small wait if the UI wants time to reflect updates.
-            import asyncio
-
             await asyncio.sleep(float(settle_s))
         st = await read_qec_status(qec_device_id=qec_device_id)
         v = st.get("syndrome")
@@ -373,16 +643,99 @@ async def acquire_repetition_measurements(
             bit = 1 if (v is not None and int(v) != 0) else 0
         except Exception:
             bit = 0
-        out.append(make_measurement(qubit=qubit, basis=basis, round=r, value=bit))
-    return out
+        bits.append(bit)
+    return bits
+
+
+async def acquire_repetition_measurements_batch(
+    *,
+    qec_device_id: str = "qec0",
+    rounds: int,
+    qubit: int = 0,
+    basis: str = "Z",
+    set_true_bit: Optional[int] = None,
+) -> List[Measurement]:
+    """Acquire all `rounds` syndrome bits with `qec.acquire_repetition` (one RPC per 256 rounds).
+
+    Raises RuntimeError if the backend rejects the call; `stonegate_api.is_unknown_method_error(e)`
+    identifies older backends without the RPC (see `acquire_repetition_measurements`).
+    """
+
+    bits = await _acquire_repetition_bits_batch(
+        qec_device_id=qec_device_id, rounds=rounds, set_true_bit=set_true_bit
+    )
+    return [make_measurement(qubit=qubit, basis=basis, round=r, value=v) for r, v in enumerate(bits)]
+
+
+async def acquire_repetition_measurements_packed(
+    *,
+    qec_device_id: str = "qec0",
+    rounds: int,
+    qubit: int = 0,
+    basis: str = "Z",
+    set_true_bit: Optional[int] = None,
+) -> PackedMeasurements:
+    """Like `acquire_repetition_measurements`, but returns the bits as `PackedMeasurements`.
+
+    Skips building per-round dicts; call `.to_dict_list()` only where a dict payload is needed.
+    """
+
+    try:
+        bits = await _acquire_repetition_bits_batch(
+            qec_device_id=qec_device_id, rounds=rounds, set_true_bit=set_true_bit
+        )
+    except RuntimeError as e:
+        if not _sg().is_unknown_method_error(e):
+            raise
+        bits = await _acquire_repetition_bits_per_round(
+            qec_device_id=qec_device_id, rounds=rounds, set_true_bit=set_true_bit, settle_s=0.0
+        )
+    return PackedMeasurements.from_bits(qubit=qubit, basis=basis, bits=bits)
+
+
+async def acquire_repetition_measurements(
+    *,
+    qec_device_id: str = "qec0",
+    rounds: int,
+    qubit: int = 0,
+    basis: str = "Z",
+    set_true_bit: Optional[int] = None,
+    settle_s: float = 0.0,
+) -> List[Measurement]:
+    """Drive the simulator to extract a syndrome bit each round and read it back.
+
+    - Noise is simulated in the backend.
+    - All rounds are acquired in one round-trip (`acquire_repetition_measurements_batch`) when
+      the backend supports it and no `settle_s` is requested; otherwise each round is triggered
+      via `device.action` and read back via `devices.poll` snapshots.
+    """
+
+    if not settle_s or settle_s <= 0:
+        try:
+            return await acquire_repetition_measurements_batch(
+                qec_device_id=qec_device_id,
+                rounds=rounds,
+                qubit=qubit,
+                basis=basis,
+                set_true_bit=set_true_bit,
+            )
+        except RuntimeError as e:
+            if not _sg().is_unknown_method_error(e):
+                raise
+
+    bits = await _acquire_repetition_bits_per_round(
+        qec_device_id=qec_device_id, rounds=rounds, set_true_bit=set_true_bit, settle_s=settle_s
+    )
+    return [make_measurement(qubit=qubit, basis=basis, round=r, value=v) for r, v in enumerate(bits)]
 
 
 def summarize_measurements(measurements: Sequence[Measurement]) -> Dict[str, Any]:
-    vals = [int(m.get("value", 0)) for m in measurements]
+    n = len(measurements)
+    ones = sum([int(m.get("value", 0)) for m in measurements])
     return {
-        "count": len(measurements),
-        "ones": int(sum(vals)),
-        "zeros": int(len(vals) - sum(vals)),
+        "count": n,
+        "ones": ones,
+        "zeros": n - ones,
     }
 
 
@@ -395,7 +748,11 @@ async def run_repetition_and_decode(
     set_true_bit: Optional[int] = None,
     timeout_s: float = 20.0,
 ) -> Dict[str, Any]:
-    """Convenience: acquire measurements from the simulator, then decode via backend RPC."""
+    """Convenience: acquire measurements from the simulator, then decode via backend RPC.
+
+    Measurements come from one batched acquisition RPC where available (see
+    `acquire_repetition_measurements`), so a run costs ~3 round-trips regardless of `rounds`.
+    """
 
     if rounds is None:
         rounds = await choose_repetition_rounds_from_hardware(qec_device_id=qec_device_id)
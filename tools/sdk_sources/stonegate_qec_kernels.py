@@ -0,0 +1,73 @@
+"""Numba kernels for `stonegate_qec`.
+
+Kept out of `stonegate_qec` so importing the QEC helpers does not import Numba or load
+the cached kernels (~0.3 s); `stonegate_qec` imports this module only for inputs large
+enough to repay that. Importing it raises ImportError when NumPy or Numba is missing.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Optional
+
+import numpy as np
+from numba import njit, prange
+
+
+def seed64(seed: Optional[int]) -> Any:
+    """Kernel seed: `seed` reduced to 64 bits, or fresh OS entropy when None."""
+
+    s = random.SystemRandom().getrandbits(64) if seed is None else int(seed) & 0xFFFFFFFFFFFFFFFF
+    return np.uint64(s)
+
+
+@njit(cache=True, inline="always")
+def _mix64(z):  # pragma: no cover - compiled
+    # splitmix64 finalizer
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+@njit(cache=True, inline="always")
+def _lerr_trial(t, rounds, p_flip, seed):  # pragma: no cover - compiled
+    # Each trial owns a splitmix64 stream derived from (seed, trial), so the
+    # result does not depend on how trials are scheduled across threads.
+    golden = np.uint64(0x9E3779B97F4A7C15)
+    x = _mix64(seed + np.uint64(t + 1) * golden)
+    ones = 0
+    for _ in range(rounds):
+        x += golden
+        if (_mix64(x) >> np.uint64(11)) * (1.0 / 9007199254740992.0) < p_flip:
+            ones += 1
+    return 1 if 2 * ones > rounds else 0
+
+
+@njit(cache=True, parallel=True)
+def lerr_kernel(trials, rounds, p_flip, seed):  # pragma: no cover - compiled
+    """Number of failed repetition-code trials (true bit 0, majority vote)."""
+
+    errs = 0
+    for t in prange(trials):
+        errs += _lerr_trial(t, rounds, p_flip, seed)
+    return errs
+
+
+# Serial, GIL-free variant for calls from worker threads (where starting the parallel
+# thread pool is not safe with every Numba threading layer). A separate function, not
+# a recompile of `lerr_kernel`, so the two get separate on-disk cache entries.
+@njit(cache=True, nogil=True)
+def lerr_kernel_nogil(trials, rounds, p_flip, seed):  # pragma: no cover - compiled
+    errs = 0
+    for t in range(trials):
+        errs += _lerr_trial(t, rounds, p_flip, seed)
+    return errs
+
+
+@njit(cache=True)
+def majority_u8(bits):  # pragma: no cover - compiled
+    ones = 0
+    n = bits.shape[0]
+    for i in range(n):
+        ones += bits[i]
+    return 1 if 2 * ones > n else 0
@@ -1,11 +1,35 @@
 import argparse
 import asyncio
 import json
-import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, List
 
-import websockets
+if TYPE_CHECKING:
+    import websockets
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    # Keep text frames: orjson returns bytes, which websockets would send as binary.
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_dumps_pretty(obj: Any) -> str:
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _json_loads(data: Any) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
 
 
 @dataclass
@@ -24,13 +48,18 @@ class RpcError(Exception):
 class StoneGateToolboxClient:
     def __init__(self, ws_url: str):
         self.ws_url = ws_url
-        self._ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._ws: Optional["websockets.WebSocketClientProtocol"] = None
         self._pending: Dict[str, asyncio.Future] = {}
+        # Per-connection request counter; the backend only needs ids unique per socket.
+        self._next_id = 0
         self._reader_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
         if self._ws is not None:
             return
+        # Imported here so offline commands (e.g. `record.load`) skip the websockets import.
+        import websockets
+
         self._ws = await websockets.connect(self.ws_url)
         self._reader_task = asyncio.create_task(self._reader())
 
@@ -46,7 +75,7 @@ class StoneGateToolboxClient:
         assert self._ws is not None
         async for raw in self._ws:
             try:
-                msg = json.loads(raw)
+                msg = _json_loads(raw)
             except Exception:
                 continue
 
@@ -66,7 +95,9 @@ class StoneGateToolboxClient:
         await self.connect()
         assert self._ws is not None
 
-        rid = uuid.uuid4().hex
+        # The backend requires a string id, so send the counter as a decimal string.
+        self._next_id += 1
+        rid = str(self._next_id)
         req = {
             "type": "rpc",
             "id": rid,
@@ -78,7 +109,7 @@ class StoneGateToolboxClient:
         fut: asyncio.Future = loop.create_future()
         self._pending[rid] = fut
 
-        await self._ws.send(json.dumps(req))
+        await self._ws.send(_json_dumps(req))
 
         try:
             resp = await asyncio.wait_for(fut, timeout=timeout_s)
@@ -105,13 +136,14 @@ def load_recording_jsonl(path: str) -> Dict[str, Any]:
     footer: Optional[Dict[str, Any]] = None
     samples: List[Dict[str, Any]] = []
 
+    loads = _orjson.loads if _orjson is not None else json.loads
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = loads(line)
             except Exception:
                 continue
             t = obj.get("type")
@@ -137,23 +169,23 @@ async def _run_cli(args: argparse.Namespace) -> int:
     try:
         if args.cmd == "devices.list":
             out = await client.call("devices.list")
-            print(json.dumps(out, indent=2))
+            print(_json_dumps_pretty(out))
             return 0
 
         if args.cmd == "devices.poll":
             out = await client.call("devices.poll")
-            print(json.dumps(out, indent=2))
+            print(_json_dumps_pretty(out))
             return 0
 
         if args.cmd == "device.action":
             params = {"device_id": args.device_id, "action": args.action}
             out = await client.call("device.action", params)
-            print(json.dumps(out, indent=2))
+            print(_json_dumps_pretty(out))
             return 0
 
         if args.cmd == "qec.decode":
             out = await client.call("qec.decode", args.params)
-            print(json.dumps(out, indent=2))
+            print(_json_dumps_pretty(out))
             return 0
 
         if args.cmd == "record.start":
@@ -167,17 +199,17 @@ async def _run_cli(args: argparse.Namespace) -> int:
                 },
                 timeout_s=args.timeout_s,
             )
-            print(json.dumps(out, indent=2))
+            print(_json_dumps_pretty(out))
             return 0
 
         if args.cmd == "record.stop":
             out = await client.call("record.stop", {"recording_id": args.recording_id}, timeout_s=args.timeout_s)
-            print(json.dumps(out, indent=2))
+            print(_json_dumps_pretty(out))
             return 0
 
         if args.cmd == "record.load":
             out = load_recording_jsonl(args.path)
-            print(json.dumps(out, indent=2))
+            print(_json_dumps_pretty(out))
             return 0
 
         raise RpcError("bad_request", f"Unknown command: {args.cmd}")